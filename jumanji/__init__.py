@@ -34,7 +34,7 @@ register(id="Game2048-v1", entry_point="jumanji.environments:Game2048")
 
 # GraphColoring - the graph coloring problem with the default graph of
 # 20 number of nodes and 0.8 edge probability.
-register(id="GraphColoring-v0", entry_point="jumanji.environments:GraphColoring")
+register(id="GraphColoring-v1", entry_point="jumanji.environments:GraphColoring")
 
 # Minesweeper on a board of size 10x10 with 10 mines.
 register(id="Minesweeper-v0", entry_point="jumanji.environments:Minesweeper")
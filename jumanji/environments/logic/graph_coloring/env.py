@@ -18,7 +18,6 @@ import chex
 import jax
 import jax.numpy as jnp
 import matplotlib.animation as animation
-from jax import lax
 from numpy.typing import NDArray
 
 from jumanji import specs
@@ -29,7 +28,7 @@ from jumanji.environments.logic.graph_coloring.generator import (
 )
 from jumanji.environments.logic.graph_coloring.types import Observation, State
 from jumanji.environments.logic.graph_coloring.viewer import GraphColoringViewer
-from jumanji.types import TimeStep, restart, termination, transition
+from jumanji.types import StepType, TimeStep, restart
 from jumanji.viewer import Viewer
 
 
@@ -43,7 +42,7 @@ class GraphColoring(Environment[State]):
     - observation: `Observation`
         - adj_matrix: jax array (bool) of shape (num_nodes, num_nodes),
             representing the adjacency matrix of the graph.
-        - colors: jax array (int32) of shape (num_nodes,),
+        - colors: jax array (int8, wider above 127 nodes) of shape (num_nodes,),
             representing the current color assignments for the vertices.
         - action_mask: jax array (bool) of shape (num_colors,),
             indicating which actions are valid in the current state of the environment.
@@ -61,7 +60,7 @@ class GraphColoring(Environment[State]):
     - state: `State`
         - adj_matrix: jax array (bool) of shape (num_nodes, num_nodes),
             representing the adjacency matrix of the graph.
-        - colors: jax array (int32) of shape (num_nodes,),
+        - colors: jax array (int8, wider above 127 nodes) of shape (num_nodes,),
             color assigned to each node, -1 if not assigned.
         - current_node_index: jax array (int) with shape (),
             index of the current node.
@@ -100,6 +99,14 @@ class GraphColoring(Environment[State]):
             num_nodes=20, edge_probability=0.8
         )
         self.num_nodes = self.generator.num_nodes
+        # Smallest signed integer type that fits every color as well as `num_nodes`, which
+        # is used as an out-of-bounds color when computing the action mask.
+        # This is int8 unless the graph has more than 127 nodes.
+        self._colors_dtype = next(
+            dtype
+            for dtype in (jnp.int8, jnp.int16, jnp.int32)
+            if jnp.iinfo(dtype).max >= self.num_nodes
+        )
 
         # Create viewer used for rendering
         self._env_viewer = viewer or GraphColoringViewer(name="GraphColoring")
@@ -113,7 +120,7 @@ class GraphColoring(Environment[State]):
         Returns:
             The initial state and timestep.
         """
-        colors = jnp.full(self.num_nodes, -1, dtype=jnp.int32)
+        colors = jnp.full(self.num_nodes, -1, dtype=self._colors_dtype)
         key, subkey = jax.random.split(key)
         adj_matrix = self.generator(subkey)
 
@@ -156,22 +163,23 @@ class GraphColoring(Environment[State]):
             state: the new state of the environment.
             timestep: the next timestep.
         """
-        # Get the valid actions for the current state.
-        valid_actions = state.action_mask
-
-        # Check if the chosen action is invalid (not in valid_actions).
-        invalid_action_taken = jnp.logical_not(valid_actions[action])
+        # Check if the chosen action is invalid (not in the current action mask).
+        invalid_action_taken = jnp.logical_not(state.action_mask[action])
 
         # Update the colors array with the chosen action.
-        colors = state.colors.at[state.current_node_index].set(action)
+        # Masked blend rather than a scatter so that XLA can fuse it with the reductions below.
+        is_current_node = jnp.arange(self.num_nodes) == state.current_node_index
+        colors = jnp.where(
+            is_current_node, jnp.asarray(action, dtype=state.colors.dtype), state.colors
+        )
 
         # Determine if all nodes have been assigned a color
         all_nodes_colored = jnp.all(colors >= 0)
 
         # Calculate the reward
-        unique_colors_used = jnp.unique(colors, size=self.num_nodes, fill_value=-1)
-        num_unique_colors = jnp.count_nonzero(unique_colors_used >= 0)
-        reward = jnp.where(all_nodes_colored, -num_unique_colors, 0.0)
+        reward = jnp.where(
+            all_nodes_colored, -self._num_unique_colors(colors).astype(float), 0.0
+        )
 
         # Apply the maximum penalty when an invalid action is taken and terminate the episode
         reward = jnp.where(invalid_action_taken, -self.num_nodes, reward)
@@ -180,8 +188,9 @@ class GraphColoring(Environment[State]):
         # Update the current node index
         next_node_index = (state.current_node_index + 1) % self.num_nodes
 
+        # Compute the action mask of the next node from the updated colors.
         next_action_mask = self._get_valid_actions(
-            next_node_index, state.adj_matrix, state.colors
+            next_node_index, state.adj_matrix, colors
         )
 
         next_state = State(
@@ -194,15 +203,16 @@ class GraphColoring(Environment[State]):
         obs = Observation(
             adj_matrix=state.adj_matrix,
             colors=colors,
-            action_mask=next_state.action_mask,
+            action_mask=next_action_mask,
             current_node_index=next_node_index,
         )
-        timestep = lax.cond(
-            done,
-            termination,
-            transition,
-            reward,
-            obs,
+        # Build the timestep without branching, equivalent to `termination` if done
+        # and `transition` otherwise.
+        timestep = TimeStep(
+            step_type=jnp.where(done, StepType.LAST, StepType.MID),
+            reward=reward,
+            discount=jnp.logical_not(done).astype(float),
+            observation=obs,
         )
         return next_state, timestep
 
@@ -215,7 +225,7 @@ class GraphColoring(Environment[State]):
                 Represents the adjacency matrix of the graph.
             - action_mask: BoundedArray (bool) of shape (num_nodes,).
                 Represents the valid actions in the current state.
-            - colors: BoundedArray (int32) of shape (num_nodes,).
+            - colors: BoundedArray (int8, wider above 127 nodes) of shape (num_nodes,).
                 Represents the colors assigned to each node.
             - current_node_index: BoundedArray (int32) of shape ().
                 Represents the index of the current node.
@@ -239,7 +249,7 @@ class GraphColoring(Environment[State]):
             ),
             colors=specs.BoundedArray(
                 shape=(self.num_nodes,),
-                dtype=jnp.int32,
+                dtype=self._colors_dtype,
                 minimum=-1,
                 maximum=self.num_nodes - 1,
                 name="colors",
@@ -267,16 +277,25 @@ class GraphColoring(Environment[State]):
         self, current_node_index: int, adj_matrix: chex.Array, colors: chex.Array
     ) -> chex.Array:
         """Returns a boolean array indicating the valid colors for the current node."""
-        # Create a boolean array of size (num_nodes + 1) set to True.
-        # The extra element is to accommodate for the -1 index
-        # which represents nodes that have not been colored yet.
-        valid_actions = jnp.ones(self.num_nodes + 1, dtype=bool)
         row = adj_matrix[current_node_index, :]
-        action_mask = jnp.where(row, colors, -1)
-        valid_actions = valid_actions.at[action_mask].set(False)
-
-        # Exclude the last element (which corresponds to -1 index)
-        return valid_actions[:-1]
+        # Colors of the neighbors of the current node. Non-neighbors and uncolored
+        # nodes are mapped to the out-of-bounds index `num_nodes` and dropped.
+        neighbor_colors = jnp.where(row & (colors >= 0), colors, self.num_nodes)
+        used_colors = (
+            jnp.zeros(self.num_nodes, dtype=bool)
+            .at[neighbor_colors]
+            .set(True, mode="drop")
+        )
+        return ~used_colors
+
+    def _num_unique_colors(self, colors: chex.Array) -> chex.Array:
+        """Returns the number of distinct colors assigned in `colors`."""
+        # Uncolored nodes are mapped to the out-of-bounds index `num_nodes` and dropped.
+        colors = jnp.where(colors >= 0, colors, self.num_nodes)
+        colors_used = (
+            jnp.zeros(self.num_nodes, dtype=bool).at[colors].set(True, mode="drop")
+        )
+        return jnp.count_nonzero(colors_used)
 
     def render(self, state: State) -> Optional[NDArray]:
         """Renders the current state of the `GraphColoring` environment.
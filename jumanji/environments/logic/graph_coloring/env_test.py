@@ -17,10 +17,12 @@ import jax
 import jax.numpy as jnp
 
 from jumanji.environments.logic.graph_coloring import GraphColoring
+from jumanji.environments.logic.graph_coloring.generator import RandomGenerator
 from jumanji.environments.logic.graph_coloring.types import State
 from jumanji.testing.env_not_smoke import check_env_does_not_smoke
 from jumanji.testing.pytrees import assert_is_jax_array_tree
 from jumanji.types import TimeStep
+from jumanji.wrappers import VmapWrapper
 
 
 def test_graph_coloring_reset_jit(graph_coloring: GraphColoring) -> None:
@@ -69,6 +71,36 @@ def test_graph_coloring_step_jit(graph_coloring: GraphColoring) -> None:
     assert not jnp.array_equal(new_state.colors, state.colors)
 
 
+def test_graph_coloring_vmap_jit(graph_coloring: GraphColoring) -> None:
+    """Confirm that a batch of environments can be reset and stepped in a single jitted call."""
+    batch_size = 4
+    env = VmapWrapper(graph_coloring)
+    num_nodes = graph_coloring.generator.num_nodes
+    chex.clear_trace_counter()
+    reset_fn = jax.jit(chex.assert_max_traces(env.reset, n=1))
+    step_fn = jax.jit(chex.assert_max_traces(env.step, n=1))
+
+    keys = jax.random.split(jax.random.PRNGKey(0), batch_size)
+    state, timestep = reset_fn(keys)
+    assert state.adj_matrix.shape == (batch_size, num_nodes, num_nodes)
+    assert timestep.observation.action_mask.shape == (batch_size, num_nodes)
+
+    action = jnp.zeros(batch_size, jnp.int32)
+    state, timestep = step_fn(state, action)
+    state, timestep = step_fn(state, action)
+    assert state.colors.shape == (batch_size, num_nodes)
+    assert timestep.reward.shape == (batch_size,)
+
+
+def test_graph_coloring_step_python_int_action(graph_coloring: GraphColoring) -> None:
+    """Confirm that the non-jitted step accepts a plain Python int as action."""
+    state, _ = graph_coloring.reset(jax.random.PRNGKey(0))
+    new_state, _ = graph_coloring.step(state, 0)
+    expected_colors = jnp.full_like(state.colors, -1).at[0].set(0)
+    assert jnp.array_equal(new_state.colors, expected_colors)
+    assert new_state.colors.dtype == state.colors.dtype
+
+
 def test_graph_coloring_get_action_mask(graph_coloring: GraphColoring) -> None:
     """Verify that the action mask generated by `_get_valid_actions` is correct."""
     key = jax.random.PRNGKey(0)
@@ -83,8 +115,80 @@ def test_graph_coloring_get_action_mask(graph_coloring: GraphColoring) -> None:
     assert action_mask.dtype == jnp.bool_
     assert action_mask.shape == (num_nodes,)
 
-    # For this specific test case, we don't have any pre-defined expected action_mask,
-    # as the graph and colors are randomly generated.
+    # Node 0 is adjacent to nodes 1 and 2, colored 1 and -1 (uncolored) respectively.
+    # Node 3 is colored 2 but is not adjacent to node 0.
+    adj_matrix = jnp.zeros((num_nodes, num_nodes), dtype=bool)
+    adj_matrix = adj_matrix.at[0, 1:3].set(True).at[1:3, 0].set(True)
+    colors = jnp.full(num_nodes, -1, dtype=jnp.int8).at[1].set(1).at[3].set(2)
+    action_mask = get_valid_actions_fn(jnp.array(0), adj_matrix, colors)
+    expected_action_mask = jnp.ones(num_nodes, dtype=bool).at[1].set(False)
+    assert jnp.array_equal(action_mask, expected_action_mask)
+
+
+def test_graph_coloring_step_updates_action_mask(
+    graph_coloring: GraphColoring,
+) -> None:
+    """Verify that the next action mask accounts for the color just assigned."""
+    num_nodes = graph_coloring.generator.num_nodes
+    # Fully connected graph: every node is adjacent to every other node.
+    state = State(
+        adj_matrix=~jnp.eye(num_nodes, dtype=bool),
+        colors=jnp.full(num_nodes, -1, dtype=jnp.int8),
+        current_node_index=jnp.array(0, jnp.int32),
+        action_mask=jnp.ones(num_nodes, dtype=bool),
+        key=jax.random.PRNGKey(0),
+    )
+    action = jnp.array(0)
+
+    new_state, timestep = jax.jit(graph_coloring.step)(state, action)
+
+    # Node 1 is adjacent to node 0, so color 0 must no longer be available.
+    assert not new_state.action_mask[action]
+    assert jnp.sum(new_state.action_mask) == num_nodes - 1
+    assert jnp.array_equal(timestep.observation.action_mask, new_state.action_mask)
+
+
+def test_graph_coloring_reward(graph_coloring: GraphColoring) -> None:
+    """Verify that the final reward is the negative number of unique colors used."""
+    num_nodes = graph_coloring.generator.num_nodes
+    # Graph without edges: any coloring is valid.
+    state = State(
+        adj_matrix=jnp.zeros((num_nodes, num_nodes), dtype=bool),
+        colors=jnp.full(num_nodes, -1, dtype=jnp.int8),
+        current_node_index=jnp.array(0, jnp.int32),
+        action_mask=jnp.ones(num_nodes, dtype=bool),
+        key=jax.random.PRNGKey(0),
+    )
+    step_fn = jax.jit(graph_coloring.step)
+    for i in range(num_nodes):
+        # Alternate between colors 0 and 1.
+        state, timestep = step_fn(state, jnp.array(i % 2))
+        if i < num_nodes - 1:
+            assert timestep.mid()
+            assert timestep.reward == 0
+    assert timestep.last()
+    assert timestep.reward == -2
+
+
+def test_graph_coloring_num_unique_colors(graph_coloring: GraphColoring) -> None:
+    """Verify that uncolored nodes are not counted as a color."""
+    num_nodes = graph_coloring.generator.num_nodes
+    colors = jnp.full(num_nodes, -1, dtype=jnp.int8).at[:3].set(jnp.array([0, 3, 3]))
+    assert jax.jit(graph_coloring._num_unique_colors)(colors) == 2
+
+
+def test_graph_coloring_colors_dtype(graph_coloring: GraphColoring) -> None:
+    """Verify that colors use the smallest integer type that fits the number of nodes."""
+    state, _ = graph_coloring.reset(jax.random.PRNGKey(0))
+    assert state.colors.dtype == jnp.int8
+    assert graph_coloring.observation_spec().colors.dtype == jnp.int8
+
+    large_graph_coloring = GraphColoring(
+        generator=RandomGenerator(num_nodes=200, edge_probability=0.5)
+    )
+    state, _ = large_graph_coloring.reset(jax.random.PRNGKey(0))
+    assert state.colors.dtype == jnp.int16
+    assert large_graph_coloring.observation_spec().colors.dtype == jnp.int16
 
 
 def test_graph_coloring_does_not_smoke(graph_coloring: GraphColoring) -> None:
@@ -16,6 +16,7 @@ import abc
 
 import chex
 import jax
+import numpy as np
 from jax import numpy as jnp
 
 
@@ -48,6 +49,8 @@ class RandomGenerator(Generator):
     The adjacency matrix is generated such that the graph is undirected and loop-less.
     The graph is generated with a specified number of nodes and percentage of connectivity,
     which is used as a proxy for the edge probability in the Erdős-Rényi model.
+    Nodes are labelled by decreasing degree, so that coloring them in index order follows
+    the largest-first heuristic.
     """
 
     def __init__(self, num_nodes: int, edge_probability: float):
@@ -66,6 +69,8 @@ class RandomGenerator(Generator):
         assert (
             0 < self.edge_probability < 1
         ), f"edge_probability={self.edge_probability} must be between 0 and 1."
+        # Indices of the strictly lower triangular part, i.e. of all possible edges.
+        self._edge_rows, self._edge_cols = np.tril_indices(num_nodes, k=-1)
 
     @property
     def num_nodes(self) -> int:
@@ -87,22 +92,26 @@ class RandomGenerator(Generator):
         Returns:
             adj_matrix: a boolean array of shape (num_nodes, num_nodes) representing
                 the adjacency matrix of the graph, where adj_matrix[i, j] is True if
-                there is an edge between nodes i and j, and False otherwise.
+                there is an edge between nodes i and j, and False otherwise. Nodes are
+                sorted by decreasing degree.
         """
-        key, edge_key = jax.random.split(key)
-
-        # Generate a random adjacency matrix with probabilities of connections.
-        p_matrix = jax.random.uniform(
-            key=edge_key, shape=(self.num_nodes, self.num_nodes)
+        # Sample each possible edge (strictly lower triangular part) independently.
+        edges = jax.random.bernoulli(
+            key=key, p=self.edge_probability, shape=self._edge_rows.shape
         )
 
-        # Threshold the probabilities to create a boolean adjacency matrix.
-        adj_matrix = p_matrix < self.edge_probability
-
-        # Make sure the graph is undirected (symmetric) and without self-loops.
-        adj_matrix = jnp.tril(adj_matrix, k=-1)  # Keep only the lower triangular part.
+        # Scatter the edges symmetrically so that the graph is undirected and without self-loops.
+        adj_matrix = (
+            jnp.zeros((self.num_nodes, self.num_nodes), dtype=bool)
+            .at[self._edge_rows, self._edge_cols]
+            .set(edges)
+            .at[self._edge_cols, self._edge_rows]
+            .set(edges)
+        )
 
-        # Copy the lower triangular part to the upper triangular part.
-        adj_matrix += adj_matrix.T
+        # Relabel the nodes by decreasing degree (largest-first ordering).
+        degrees = jnp.sum(adj_matrix, axis=1)
+        order = jnp.argsort(-degrees)
+        adj_matrix = adj_matrix[order][:, order]
 
         return adj_matrix
@@ -0,0 +1,63 @@
+# Copyright 2022 InstaDeep Ltd. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import chex
+import jax
+import jax.numpy as jnp
+import pytest
+
+from jumanji.environments.logic.graph_coloring.generator import RandomGenerator
+from jumanji.testing.pytrees import assert_trees_are_different
+
+
+class TestRandomGenerator:
+    @pytest.fixture
+    def random_generator(self) -> RandomGenerator:
+        return RandomGenerator(num_nodes=20, edge_probability=0.8)
+
+    def test_random_generator__properties(
+        self, random_generator: RandomGenerator
+    ) -> None:
+        """Validate that the random instance generator has the correct properties."""
+        assert random_generator.num_nodes == 20
+        assert random_generator.edge_probability == 0.8
+
+    def test_random_generator__call(self, random_generator: RandomGenerator) -> None:
+        """Validate that the random instance generator's call function is jit-able and compiles
+        only once. Also check that giving two different keys results in two different instances.
+        """
+        chex.clear_trace_counter()
+        call_fn = jax.jit(chex.assert_max_traces(random_generator.__call__, n=1))
+        adj_matrix1 = call_fn(key=jax.random.PRNGKey(1))
+        assert adj_matrix1.shape == (20, 20)
+        assert adj_matrix1.dtype == jnp.bool_
+
+        adj_matrix2 = call_fn(key=jax.random.PRNGKey(2))
+        assert_trees_are_different(adj_matrix1, adj_matrix2)
+
+    def test_random_generator__undirected_without_self_loops(
+        self, random_generator: RandomGenerator
+    ) -> None:
+        """Validate that the generated graph is symmetric and has no self-loops."""
+        adj_matrix = random_generator(jax.random.PRNGKey(0))
+        assert jnp.array_equal(adj_matrix, adj_matrix.T)
+        assert not jnp.any(jnp.diag(adj_matrix))
+
+    def test_random_generator__sorted_by_degree(
+        self, random_generator: RandomGenerator
+    ) -> None:
+        """Validate that the nodes of the generated graph are sorted by decreasing degree."""
+        adj_matrix = random_generator(jax.random.PRNGKey(0))
+        degrees = jnp.sum(adj_matrix, axis=1)
+        assert jnp.all(degrees[:-1] >= degrees[1:])